@@ -9,6 +9,39 @@ dotenv.load_dotenv()
 mcp = FastMCP("Notion-GitHub MCP Server")
 mcp.add_middleware(UserAuthMiddleware())
 
+def _rich_text_to_plain(rich_text: list) -> str:
+    """Concatena el texto plano de una lista de segmentos rich_text de Notion."""
+    return "".join(segment.get("plain_text", "") for segment in rich_text)
+
+def _extract_page_title(page: dict) -> str:
+    """Extrae el título de una página de Notion o devuelve 'Sin título'."""
+    title_prop = page.get("properties", {}).get("Title", {})
+    if title_prop.get("title"):
+        return _rich_text_to_plain(title_prop["title"]).strip()
+    return "Sin título"
+
+def _compact_pages(search_results: dict) -> dict:
+    """Resume un resultado de búsqueda de Notion en formato estructurado compacto."""
+    return {
+        "pages": [
+            {"id": page.get("id"), "title": _extract_page_title(page)}
+            for page in search_results.get("results", [])
+        ],
+        "next_cursor": search_results.get("next_cursor"),
+    }
+
+def _compact_block(block: dict) -> dict:
+    """Resume un bloque de Notion con su ID, tipo y texto plano."""
+    block_type = block.get("type")
+    block_data = block.get(block_type, {})
+    compact = {"id": block.get("id"), "type": block_type}
+    text = _rich_text_to_plain(block_data.get("rich_text", []))
+    if text:
+        compact["text"] = text
+    if block_type == "code":
+        compact["language"] = block_data.get("language", "text")
+    return compact
+
 @mcp.tool()
 def create_page(title: str, notion_database_id: str, context: Context = None) -> str:
     """
@@ -164,14 +197,15 @@ def append_code_block(page_id: str, code: str, language: str, context: Context =
     except Exception as e:
         return f"Error al agregar bloque de código: {str(e)}"
 
-@mcp.tool()
-def search_a_page_in_notion(search_query: str, limit: int = 10, context: Context = None) -> str:
+@mcp.tool(output_schema=None)
+def search_a_page_in_notion(search_query: str, limit: int = 10, structured: bool = False, context: Context = None) -> str | dict:
     """
     Busca páginas existentes en Notion por título o contenido.
 
     Args:
         search_query: Término de búsqueda para encontrar páginas
         limit: Número máximo de resultados a devolver (por defecto 10)
+        structured: Si es True, devuelve JSON compacto con "pages" (id, title) y "next_cursor" en lugar de texto markdown
 
     Returns:
         Lista de páginas encontradas con su ID, título y URL
@@ -185,6 +219,9 @@ def search_a_page_in_notion(search_query: str, limit: int = 10, context: Context
             page_size=limit
         )
 
+        if structured:
+            return _compact_pages(search_results)
+
         # Procesar resultados
         pages = search_results.get("results", [])
 
@@ -195,15 +232,7 @@ def search_a_page_in_notion(search_query: str, limit: int = 10, context: Context
         results = []
         for page in pages:
             page_id = page.get("id", "N/A")
-            properties = page.get("properties", {})
-            title_prop = properties.get("Title", {})
-
-            # Extraer título
-            title = "Sin título"
-            if title_prop.get("title"):
-                print(title_prop.get("Title"))
-                title_parts = [part.get("plain_text", "") for part in title_prop["title"]]
-                title = "".join(title_parts).strip()
+            title = _extract_page_title(page)
 
             # Crear URL de la página (formato estándar de Notion)
             page_url = f"https://notion.so/{page_id.replace('-', '')}"
@@ -215,16 +244,19 @@ def search_a_page_in_notion(search_query: str, limit: int = 10, context: Context
         return result_text
 
     except Exception as e:
+        if structured:
+            return {"error": str(e)}
         return f"Error al buscar páginas: {str(e)}"
 
-@mcp.tool()
-def list_pages_in_notion(start_cursor: str = None, limit: int = 20, context: Context = None) -> str:
+@mcp.tool(output_schema=None)
+def list_pages_in_notion(start_cursor: str = None, limit: int = 20, structured: bool = False, context: Context = None) -> str | dict:
     """
     Lista todas las páginas existentes en Notion.
 
     Args:
         start_cursor: posición de inicio para la paginación. Si no se proporciona, se devuelve la primera página. Se debe extraer del resultado de la función anterior.
         limit: Número máximo de resultados a devolver (por defecto 20)
+        structured: Si es True, devuelve JSON compacto con "pages" (id, title) y "next_cursor" en lugar de texto markdown
 
     Returns:
         Lista de páginas encontradas con su ID, título y URL
@@ -244,6 +276,9 @@ def list_pages_in_notion(start_cursor: str = None, limit: int = 20, context: Con
             search_object["start_cursor"] = start_cursor
         search_results = notion.search(**search_object)
 
+        if structured:
+            return _compact_pages(search_results)
+
         # Procesar resultados
         pages = search_results.get("results", [])
 
@@ -254,15 +289,7 @@ def list_pages_in_notion(start_cursor: str = None, limit: int = 20, context: Con
         results = []
         for page in pages:
             page_id = page.get("id", "N/A")
-            properties = page.get("properties", {})
-            title_prop = properties.get("Title", {})
-
-            # Extraer título
-            title = "Sin título"
-            if title_prop.get("title"):
-                print(title_prop.get("Title"))
-                title_parts = [part.get("plain_text", "") for part in title_prop["title"]]
-                title = "".join(title_parts).strip()
+            title = _extract_page_title(page)
 
             # Crear URL de la página (formato estándar de Notion)
             page_url = f"https://notion.so/{page_id.replace('-', '')}"
@@ -271,42 +298,58 @@ def list_pages_in_notion(start_cursor: str = None, limit: int = 20, context: Con
 
         result_text = f"**Resultados de búsqueda** ({len(pages)} encontrados):\n\n" + "\n".join(results)
 
+        next_cursor = search_results.get("next_cursor")
+        if next_cursor:
+            result_text += f"\n\n**Siguiente cursor:** {next_cursor}"
+
         return result_text
 
     except Exception as e:
+        if structured:
+            return {"error": str(e)}
         return f"Error al buscar páginas: {str(e)}"
 
-@mcp.tool()
-def get_notion_page_content(page_id: str, context: Context = None) -> str:
+@mcp.tool(output_schema=None)
+def get_notion_page_content(page_id: str, start_cursor: str = None, structured: bool = False, context: Context = None) -> str | dict:
     """
     Obtiene todo el contenido de una página existente de Notion, separado en bloques individuales.
 
     Args:
         page_id: ID de la página de Notion
+        start_cursor: posición de inicio para la paginación de bloques. Se debe extraer del "Siguiente cursor" (o "next_cursor" en modo estructurado) de la llamada anterior. Si se proporciona, no se vuelve a obtener el título de la página.
+        structured: Si es True, devuelve JSON compacto con "title" (solo sin start_cursor), "blocks" (id, type, text) y "next_cursor" en lugar de texto markdown
 
     Returns:
         Contenido completo formateado con información de bloques individuales para edición
     """
     try:
         notion = context.get_state("notion")
-        # Obtener información básica de la página
-        page = notion.pages.retrieve(page_id)
-
-        # Obtener propiedades de la página
-        properties = page.get("properties", {})
-        title_prop = properties.get("Title", {})
-
-        # Extraer título
-        title = "Sin título"
-        if title_prop.get("title"):
-            title_parts = [part.get("plain_text", "") for part in title_prop["title"]]
-            title = "".join(title_parts).strip()
+        # Obtener el título solo en la primera llamada; las siguientes páginas de bloques no lo repiten
+        title = None
+        if not start_cursor:
+            page = notion.pages.retrieve(page_id)
+            title = _extract_page_title(page)
 
         # Obtener bloques de contenido de la página
-        blocks = notion.blocks.children.list(page_id)
+        list_object = {"block_id": page_id}
+        if start_cursor:
+            list_object["start_cursor"] = start_cursor
+        blocks = notion.blocks.children.list(**list_object)
         block_objects = blocks.get("results", [])
 
+        next_cursor = blocks.get("next_cursor")
+
+        if structured:
+            response = {"id": page_id}
+            if title is not None:
+                response["title"] = title
+            response["blocks"] = [_compact_block(block) for block in block_objects]
+            response["next_cursor"] = next_cursor
+            return response
+
         if not block_objects:
+            if title is None:
+                return f"No hay más bloques en la página (ID: {page_id})."
             return f"La página '{title}' está vacía o no tiene contenido accesible."
 
         # Procesar bloques individuales
@@ -411,19 +454,15 @@ def get_notion_page_content(page_id: str, context: Context = None) -> str:
                 blocks_info.append(block_info)
 
         # Crear contenido completo formateado
-        full_content = f"# {title}\n\n" + "\n".join(formatted_blocks)
-
-        # Crear respuesta estructurada
-        response = {
-            "title": title,
-            "page_id": page_id,
-            "full_content": full_content,
-            "blocks": blocks_info,
-            "total_blocks": len(blocks_info)
-        }
+        if title is not None:
+            header = f"**Página: {title}** (ID: {page_id})"
+            full_content = f"# {title}\n\n" + "\n".join(formatted_blocks)
+        else:
+            header = f"**Página (continuación)** (ID: {page_id})"
+            full_content = "\n".join(formatted_blocks)
 
         # Formatear respuesta para que sea fácil de leer y usar
-        formatted_response = f"""**Página: {title}** (ID: {page_id})
+        formatted_response = f"""{header}
 
 **Contenido completo:**
 {full_content}
@@ -442,9 +481,14 @@ def get_notion_page_content(page_id: str, context: Context = None) -> str:
 - Usar update_block(block_id="{block_id}", new_content="...", block_type="{block_type}")
 """
 
+        if next_cursor:
+            formatted_response += f"\n**Siguiente cursor:** {next_cursor}\n"
+
         return formatted_response
 
     except Exception as e:
+        if structured:
+            return {"error": str(e)}
         return f"Error al obtener contenido de la página: {str(e)}"
 
 @mcp.tool()